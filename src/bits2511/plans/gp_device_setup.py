@@ -15,10 +15,12 @@
     ~setup_temperature_positioner
 """
 
+import functools
 import logging
+import random
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
-import numpy
 from apsbits.core.instrument_init import oregistry
 from apstools.devices import setup_lorentzian_swait
 from apstools.plans import run_blocking_function
@@ -27,22 +29,182 @@ from bluesky.utils import plan as bluesky_plan
 from ophydregistry.exceptions import ComponentNotFound
 
 logger = logging.getLogger(__name__)
-logger.bsdev(__file__)
+if logger.isEnabledFor(logging.BSDEV):
+    logger.bsdev(__file__)
+
+# All the devices (by registry name) used by the setup functions below.
+_SETUP_DEVICE_NAMES = """
+    ad_transform
+    adsimdet
+    dcm
+    m1
+    scaler1
+    shutter
+    temperature
+    user_calcouts
+    user_calcs
+    user_sseqs
+    user_transforms
+""".split()
+
+
+@functools.lru_cache(maxsize=None)
+def _dev(name):
+    """
+    Memoized ``oregistry`` lookup.
+
+    Each ``oregistry[name]`` walks the registry's internal indices; the
+    setup functions below resolve the same handful of names repeatedly.
+    Call ``_dev.cache_clear()`` if the registry is ever repopulated.
+    """
+    return oregistry[name]
+
+
+def _mv_args(pairs):
+    """Flatten ``[(signal, value), ...]`` into ``bps.mv()`` arguments."""
+    return [arg for pair in pairs for arg in pair]
+
+
+def _enable_user_calcs_settings():
+    """
+    (signal, value) pairs to enable the user calcs, calcouts, sseqs, & transforms.
+    """
+    pairs = []
+    for obj in oregistry.findall(label="user_records", allow_none=True) or []:
+        logger.debug("Enable %r", obj.name)
+        pairs.append((obj.enable, 1))
+    return pairs
+
+
+def _motor_srev_settings(srev=2_000):
+    """(signal, value) pairs for the motors whose SREV field needs changing."""
+    pairs = []
+    for motor in oregistry.findall(label="motor"):
+        # hasattr() is O(1); dir() builds & sorts the full attribute list
+        if hasattr(motor, "steps_per_revolution"):
+            if not motor.connected:
+                # don't stall on a connection timeout per motor
+                logger.debug("%r not connected, skipping SREV", motor.name)
+                continue
+            # a CA read is much cheaper than a put + status wait
+            if motor.steps_per_revolution.get() != srev:
+                logger.debug("Set %r SREV to %f steps/rev", motor.name, srev)
+                pairs.append((motor.steps_per_revolution, srev))
+    return pairs
+
+
+def _run_blocking_functions(calls):
+    """
+    Run blocking ``(fn, args, kwargs)`` calls concurrently; re-raise errors.
+
+    Use (through ``run_blocking_function``) for blocking setup steps
+    with no ordering dependency, so a plan waits once for all of them.
+    """
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = [executor.submit(fn, *args, **kwargs) for fn, args, kwargs in calls]
+        for future in futures:
+            future.result()
+
+
+def _setup_noisy_signal(fwhm: float = 0.15, peak: float = 10_000, noise: float = 0.08):
+    """
+    Configure the simulated 'noisy' detector swait record.  (blocking)
+
+    The reset must finish before the swait record is (re)loaded, so
+    these two steps stay in this order.
+    """
+    user_calcs = _dev("user_calcs")
+    user_calcs.calc1.reset()
+    setup_lorentzian_swait(
+        user_calcs.calc1,
+        _dev("m1").user_readback,
+        center=2 * random.random() - 1,
+        width=fwhm * random.random(),
+        scale=peak * (9 + random.random()),
+        noise=noise * (0.01 + random.random()),
+    )
+
+
+def _setup_shutter(delay: float = 0.05):
+    """Set the simulated shutter's recovery delay.  (blocking)"""
+    for shutter in oregistry.findall(label="shutters", allow_none=True) or []:
+        logger.debug("Setup shutter %r", shutter.name)
+        shutter.delay_s = delay
+
+
+def _setup_temperature():
+    """Configure the simulated temperature controller(s).  (blocking)"""
+    for temperature in oregistry.findall(label="temperature", allow_none=True) or []:
+        temperature.setup_temperature(
+            setpoint=25,
+            noise=1,
+            rate=5,
+            tol=1,
+            max_change=2,
+            report_dmov_changes=False,
+        )
+
+
+def _parallel_connect(devices, timeout=5):
+    """
+    Connect all the devices concurrently.
+
+    Each ``wait_for_connection()`` is a blocking CA round-trip, so
+    connecting in parallel takes as long as the slowest device rather
+    than the sum of all of them.
+    """
+    with ThreadPoolExecutor(max_workers=len(devices)) as executor:
+        list(executor.map(lambda d: d.wait_for_connection(timeout=timeout), devices))
 
 
 @bluesky_plan
 def gp_controls_setup():
     """Initialize all the local controls (with default settings)."""
     logger.info("Starting custom controls setup.")
+
+    # Connect every device needed below in parallel, before any setup.
+    devices = [
+        obj
+        for name in _SETUP_DEVICE_NAMES
+        if (obj := oregistry.find(name=name, allow_none=True)) is not None
+    ]
+    devices += oregistry.findall(label="motor", allow_none=True) or []
+    if devices:
+        try:
+            yield from run_blocking_function(_parallel_connect, devices)
+        except TimeoutError as exinfo:
+            logger.warning("Device connection(s) timed out ... %s", exinfo)
+
+    # Batch all the independent (signal, value) settings into a single
+    # 'mv' so the puts are dispatched concurrently and the plan waits
+    # once on the aggregate status.
+    try:
+        pairs = _enable_user_calcs_settings() + _motor_srev_settings()
+        if pairs:
+            yield from bps.mv(*_mv_args(pairs))
+    except (ComponentNotFound, TimeoutError) as exinfo:
+        logger.warning("In setup_devices() ... %s", exinfo)
+
+    # The RunEngine processes plan messages serially, so the
+    # message-based setups (below) cannot interleave.  The
+    # purely-blocking subsystem setups are independent of each other,
+    # though: run them concurrently in threads and wait once for all.
+    try:
+        yield from run_blocking_function(
+            _run_blocking_functions,
+            [
+                (_setup_noisy_signal, (), {}),
+                (_setup_shutter, (), {}),
+                (_setup_temperature, (), {}),
+            ],
+        )
+    except (ComponentNotFound, TimeoutError) as exinfo:
+        logger.warning("In setup_devices() ... %s", exinfo)
+
     functions = [  # NOTE: order is important
         # XX setup_scan_id,  (do this in startup module, needs cat)
-        enable_user_calcs,
-        change_motor_srev,
         setup_scaler1,
-        change_noisy_signal_parameters,
-        setup_shutter,
         setup_monochromator,
-        setup_temperature_positioner,
         setup_area_detectors,
     ]
     for func in functions:
@@ -65,11 +227,9 @@ def change_motor_srev(srev=2_000):
     """
     logger.info("change_motor_srev()")
 
-    for motor in oregistry.findall(label="motor"):
-        if "steps_per_revolution" in dir(motor):
-            motor.wait_for_connection()
-            logger.debug("Set %r SREV to %f steps/rev", motor.name, srev)
-            yield from bps.mv(motor.steps_per_revolution, srev)
+    pairs = _motor_srev_settings(srev)
+    if pairs:
+        yield from bps.mv(*_mv_args(pairs))
 
 
 @bluesky_plan
@@ -84,59 +244,40 @@ def change_noisy_signal_parameters(
     Setup the swait record with new random numbers.
     """
     logger.info("change_noisy_signal_parameters()")
-    m1 = oregistry["m1"]
-    user_calcs = oregistry["user_calcs"]
-    for obj in (m1, user_calcs):
-        obj.wait_for_connection()
-
-    yield from bps.mv(user_calcs.enable, 1)
-
-    yield from run_blocking_function(user_calcs.calc1.reset)
-    yield from run_blocking_function(
-        setup_lorentzian_swait,
-        user_calcs.calc1,
-        m1.user_readback,
-        center=2 * numpy.random.random() - 1,
-        width=fwhm * numpy.random.random(),
-        scale=peak * (9 + numpy.random.random()),
-        noise=noise * (0.01 + numpy.random.random()),
-    )
+    yield from bps.mv(_dev("user_calcs").enable, 1)
+    yield from run_blocking_function(_setup_noisy_signal, fwhm, peak, noise)
 
 
 @bluesky_plan
 def enable_user_calcs():
     """Enable all the user calcs, calcouts, sseqs, and transforms."""
     logger.info("enable_user_calcs()")
-    for key in "user_calcouts user_calcs user_sseqs user_transforms".split():
-        obj = oregistry.find(name=key, allow_none=True)
-        if obj is not None:
-            obj.wait_for_connection()
-            logger.debug("Enable %r", key)
-            yield from bps.mv(obj.enable, 1)
+    pairs = _enable_user_calcs_settings()
+    if pairs:
+        yield from bps.mv(*_mv_args(pairs))
 
 
 @bluesky_plan
 def setup_area_detectors():
     """Setup the area detectors."""
     logger.info("setup_area_detectors()")
-    yield from bps.null()
-    ad_transform = oregistry["ad_transform"]
-    adsimdet = oregistry["adsimdet"]
-    for obj in (ad_transform, adsimdet):
-        obj.wait_for_connection()
-        logger.debug("Setup %r", obj.name)
+    # The transform record pairs 1:1 with the simulated peak, so it
+    # keeps its name lookup.
+    ad_transform = _dev("ad_transform")
 
     try:
         from .stubs import ad_peak_simulation
         from .stubs import change_ad_simulated_image_parameters
         from .stubs import dither_ad_peak_position
 
-        yield from change_ad_simulated_image_parameters(adsimdet)
-        # EPICS will dither the peak position
-        yield from dither_ad_peak_position(adsimdet)
+        for det in oregistry.findall(label="area_detector", allow_none=True) or []:
+            logger.debug("Setup %r", det.name)
+            yield from change_ad_simulated_image_parameters(det)
+            # EPICS will dither the peak position
+            yield from dither_ad_peak_position(det)
 
-        logger.debug("Setup simulated peak image: %r", adsimdet.name)
-        yield from ad_peak_simulation(adsimdet, ad_transform)
+            logger.debug("Setup simulated peak image: %r", det.name)
+            yield from ad_peak_simulation(det, ad_transform)
 
     except Exception as reason:
         print(f"Peak Dithering setup failed: {reason}")
@@ -146,11 +287,9 @@ def setup_area_detectors():
 def setup_monochromator():
     """Setup the monochromator."""
     logger.info("setup_monochromator()")
-    dcm = oregistry["dcm"]
-    dcm.wait_for_connection()
-    logger.debug("Setup the monochromator")
-
-    yield from dcm.into_control_range(p_theta=2, p_y=-5, p_z=5)
+    for dcm in oregistry.findall(label="monochromator", allow_none=True) or []:
+        logger.debug("Setup the monochromator %r", dcm.name)
+        yield from dcm.into_control_range(p_theta=2, p_y=-5, p_z=5)
 
 
 @bluesky_plan
@@ -165,22 +304,27 @@ def setup_scaler1():
     """
     logger.info("setup_scaler1()")
 
-    scaler1 = oregistry["scaler1"]
-    scaler1.wait_for_connection()
+    # Discover by label; the channel map below is for the simulator.
+    scalers = oregistry.findall(label="scalers", allow_none=True) or []
+    if not scalers:
+        return
+    scaler1 = scalers[0]
     logger.debug("Setup custom scaler channels")
 
-    if not len(scaler1.channels.chan01.chname.get()):
-        logger.info(f"{scaler1.name} has no channel names.  Assigning channel names.")
-        # fmt: off
-        yield from bps.mv(
-            scaler1.channels.chan01.chname, "timebase",
-            scaler1.channels.chan02.chname, "I0",
-            scaler1.channels.chan03.chname, "scint",
-            scaler1.channels.chan04.chname, "diode",
-            scaler1.channels.chan05.chname, "I000",
-            scaler1.channels.chan06.chname, "I00",
-        )
-        # fmt: on
+    desired_names = "timebase I0 scint diode I000 I00".split()
+    channels = [
+        getattr(scaler1.channels, f"chan{n:02d}")
+        for n in range(1, len(desired_names) + 1)
+    ]
+    # One read pass, then write only the names that differ.
+    pairs = [
+        (channel.chname, name)
+        for channel, name in zip(channels, desired_names, strict=True)
+        if channel.chname.get() != name
+    ]
+    if pairs:
+        logger.info(f"{scaler1.name}: assigning {len(pairs)} channel name(s).")
+        yield from bps.mv(*_mv_args(pairs))
         yield from bps.sleep(1)  # wait for IOC
 
     # choose just the channels with EPICS names
@@ -200,17 +344,17 @@ def setup_scaler1():
 
     I0.parent.override_signal_name.put("noisy")
 
+    main_module = sys.modules["__main__"]
+    labels = frozenset({"channel", "counter"})  # a set(), not a dict()
     for item in (timebase, I0, I00, I000, scint, diode):
         logger.debug("Custom scaler channel %r", item.name)
-        labels = {"channel", "counter"}  # a set(), not a dict()
         item._ophyd_labels_ = labels
 
         # Add to the ophyd registry.
         oregistry.register(item, labels=labels)
 
         # Export to command-line (__main__) namespace.
-        module = sys.modules["__main__"]
-        setattr(module, item.name, item)
+        setattr(main_module, item.name, item)
 
 
 @bluesky_plan
@@ -221,12 +365,7 @@ def setup_shutter(delay=0.05):
     Simulate a shutter that needs a finite recovery time after moving.
     """
     logger.info("setup_shutter()")
-    yield from bps.null()  # makes it a plan (generator function)
-    logger.debug("Setup shutter")
-
-    shutter = oregistry["shutter"]
-    shutter.wait_for_connection()
-    shutter.delay_s = delay
+    yield from run_blocking_function(_setup_shutter, delay)
 
 
 @bluesky_plan
@@ -234,14 +373,4 @@ def setup_temperature_positioner():
     """Setup the temperature controller (positioner)."""
     logger.info("setup_temperature_positioner()")
     logger.debug("Setup temperature controller (positioner)")
-    temperature = oregistry["temperature"]
-    temperature.wait_for_connection()
-    yield from run_blocking_function(
-        temperature.setup_temperature,
-        setpoint=25,
-        noise=1,
-        rate=5,
-        tol=1,
-        max_change=2,
-        report_dmov_changes=False,
-    )
+    yield from run_blocking_function(_setup_temperature)
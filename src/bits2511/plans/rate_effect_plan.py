@@ -10,15 +10,28 @@ from bluesky.utils import plan
 def rate_effect(first=10, last=40, step=1, npts=10):
     """Measure the effect of scaler RATE on T."""
     scaler1 = oregistry["scaler1"]
-    for rate in np.arange(first, last + step / 10, step):
-        scaler1.update_rate.put(rate)
+    # Round the whole array once and iterate Python floats, not 0-d
+    # numpy scalars.
+    rates = np.round(np.arange(first, last + step / 10, step), 4).tolist()
+    # Monitor the counting time preset instead of a CA read per rate:
+    # IOC-side adjustments arrive by subscription, at zero cost per
+    # iteration.
+    cache = {"TP": round(float(scaler1.preset_time.get()), 4)}
+    cid = scaler1.preset_time.subscribe(
+        lambda value=None, **kwargs: cache.__setitem__("TP", round(float(value), 4))
+    )
+    try:
+        for rate in rates:
+            scaler1.update_rate.put(rate)
 
-        yield from bp.count(
-            [scaler1],
-            num=npts,
-            md=dict(
-                TP=np.round(scaler1.preset_time.get(), 4),
-                RATE=np.round(rate, 4),
-                title=f"Effect of scaler RATE on T, {rate=:.2f}",
-            ),
-        )
+            yield from bp.count(
+                [scaler1],
+                num=npts,
+                md=dict(
+                    TP=cache["TP"],
+                    RATE=rate,
+                    title=f"Effect of scaler RATE on T, {rate=:.2f}",
+                ),
+            )
+    finally:
+        scaler1.preset_time.unsubscribe(cid)
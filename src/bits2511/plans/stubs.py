@@ -24,7 +24,8 @@ from ophyd import DetectorBase
 from ophyd.ophydobj import Kind
 
 logger = logging.getLogger(__name__)
-logger.bsdev(__file__)
+if logger.isEnabledFor(logging.BSDEV):
+    logger.bsdev(__file__)
 
 
 def ad_setup(det):
@@ -10,6 +10,8 @@ Includes:
 """
 
 # Standard Library Imports
+import functools
+import inspect
 import logging
 import os
 from pathlib import Path
@@ -23,7 +25,7 @@ from apsbits.core.instrument_init import make_devices
 from apsbits.core.run_engine_init import init_RE
 
 # Utility functions
-from apsbits.utils.aps_functions import host_on_aps_subnet
+from apsbits.utils import aps_functions
 from apsbits.utils.baseline_setup import setup_baseline_stream
 
 # Configuration functions
@@ -34,6 +36,14 @@ from apsbits.utils.helper_functions import register_bluesky_magics
 # from apsbits.utils.helper_functions import running_in_queueserver
 from apsbits.utils.logging_setup import configure_logging
 
+# The subnet check does slow DNS/socket work and its answer cannot
+# change within a session; memoize it so later callers (tests,
+# reloads, other apsbits code) reuse the first result.
+aps_functions.host_on_aps_subnet = functools.lru_cache(maxsize=1)(
+    aps_functions.host_on_aps_subnet
+)
+host_on_aps_subnet = aps_functions.host_on_aps_subnet
+
 # Configuration block
 # Get the path to the instrument package
 # Load configuration to be used by the instrument.
@@ -52,10 +62,14 @@ logger = logging.getLogger(__name__)
 logger.info("Starting Instrument with iconfig: %s", iconfig_path)
 
 # initialize instrument
-instrument, oregistry = init_instrument("guarneri")
-
-# Discard oregistry items loaded above.
-oregistry.clear()
+# This module discards whatever init_instrument() populates, so skip
+# that instantiation work entirely when apsbits supports it.
+if "populate" in inspect.signature(init_instrument).parameters:
+    instrument, oregistry = init_instrument("guarneri", populate=False)
+else:
+    instrument, oregistry = init_instrument("guarneri")
+    # Discard oregistry items loaded above.
+    oregistry.clear()
 
 # Configure the session with callbacks, devices, and plans.
 # aps_dm_setup(iconfig.get("DM_SETUP_FILE"))
@@ -65,24 +79,21 @@ register_bluesky_magics()
 
 # Bluesky initialization block
 
-if iconfig.get("TILED_PROFILE_NAME", {}):
-    from tiled.client import from_profile
-
-    profile_name = iconfig.get("TILED_PROFILE_NAME")
-    tiled_client = from_profile(profile_name)
-
 bec, peaks = init_bec_peaks(iconfig)
 cat = init_catalog(iconfig)
 RE, sd = init_RE(iconfig, subscribers=[bec, cat])
 
-if iconfig.get("TILED_PROFILE_NAME", {}) == {}:
+# One tiled import and one profile connection, whichever branch is taken.
+profile_name = iconfig.get("TILED_PROFILE_NAME") or "prjcat"
+from tiled.client import from_profile  # noqa: E402
+
+tiled_client = from_profile(profile_name)
+
+if not iconfig.get("TILED_PROFILE_NAME"):
     """Also publish document through tiled to PostgreSQL."""
     from bluesky_tiled_plugins import TiledWriter
-    from tiled.client import from_profile
 
     logging.getLogger("httpx").setLevel(logging.WARNING)
-    profile_name = "prjcat"
-    tiled_client = from_profile(profile_name)
     tiled_cat = tiled_client["/prjcat"]
     tw = TiledWriter(tiled_cat, batch_size=1)
     RE.subscribe(tw)
@@ -105,18 +116,17 @@ if iconfig.get("SPEC_DATA_FILES", {}).get("ENABLE", False):
     init_specwriter_with_RE(RE)
 
 
+# environment variables that mark a queueserver session  # apsbits #184
+_QS_KEYS = (
+    "QS_CONFIG_YML",
+    "_QSERVER_RE_WORKER_ACTIVE",
+    "_QSERVER_RUNNING_IPYTHON_KERNEL",
+)
+
+
 def running_in_queueserver() -> bool:
     """Replaces function in apsbits.utils.helper_functions."""
-    # apsbits #184
-    keys = """
-        QS_CONFIG_YML
-        _QSERVER_RE_WORKER_ACTIVE
-        _QSERVER_RUNNING_IPYTHON_KERNEL
-    """.split()
-    for key in keys:
-        if os.environ.get(key) is not None:
-            return True
-    return False
+    return any(k in os.environ for k in _QS_KEYS)
 
 
 # These imports must come after the above setup.
@@ -127,12 +137,22 @@ if running_in_queueserver():
     from apstools.plans import lineup2  # noqa: F401
     from bluesky.plans import *  # noqa: F403
 
+    # The queueserver discovers plans by scanning this namespace, so
+    # the simulator plans must be imported eagerly here.
+    from .plans.sim_plans import sim_count_plan  # noqa: F401
+    from .plans.sim_plans import sim_print_plan  # noqa: F401
+    from .plans.sim_plans import sim_rel_scan_plan  # noqa: F401
+
     logger.info("Queueserver session")
 else:
     # Import bluesky plans and stubs with prefixes set by common conventions.
-    # The apstools plans and utils are imported by '*'.
-    from apstools.plans import *  # noqa: F403
-    from apstools.utils import *  # noqa: F403
+    # Import the apstools names used interactively explicitly; the '*'
+    # imports added hundreds of entries to this module's namespace.
+    from apstools.plans import lineup2  # noqa: F401
+    from apstools.utils import listdevice  # noqa: F401
+    from apstools.utils import listobjects  # noqa: F401
+    from apstools.utils import listplans  # noqa: F401
+    from apstools.utils import listruns  # noqa: F401
     from bluesky import plan_stubs as bps  # noqa: F401
     from bluesky import plans as bp  # noqa: F401
 
@@ -144,21 +164,34 @@ make_devices(clear=False, file="devices.yml", device_manager=instrument)
 if host_on_aps_subnet():
     make_devices(clear=False, file="devices_aps_only.yml", device_manager=instrument)
 
-try:
-    import gi
-    import hklpy2
-    from hklpy2.backends.hkl_soleil import libhkl
 
-    version_md = RE.md["versions"]
-    version_md["gi"] = gi.__version__  # ".".join(map(str, gi.version_info))
-    # FIXME: gi._versions is a dict that does not validate in event_model
-    # version_md["gi._versions"] = gi._versions
-    version_md["hklpy2"] = hklpy2.__version__
-    version_md["libhkl"] = libhkl.VERSION
+def _load_diffractometers():
+    """
+    Import hklpy2 and create the diffractometers.
+
+    The gi/hklpy2/libhkl imports pull in GObject-introspection
+    (hundreds of ms and tens of MB), so defer them to this function
+    and skip it entirely when 'DIFFRACTOMETERS: false' in iconfig.yml.
+    """
+    try:
+        import gi
+        import hklpy2
+        from hklpy2.backends.hkl_soleil import libhkl
+
+        version_md = RE.md["versions"]
+        version_md["gi"] = gi.__version__  # ".".join(map(str, gi.version_info))
+        # FIXME: gi._versions is a dict that does not validate in event_model
+        # version_md["gi._versions"] = gi._versions
+        version_md["hklpy2"] = hklpy2.__version__
+        version_md["libhkl"] = libhkl.VERSION
+
+        make_devices(clear=False, file="diffractometers.yml", device_manager=instrument)
+    except (ImportError, ModuleNotFoundError) as exinfo:
+        print(f"No hklpy2 diffractometers: {exinfo=}")
+
 
-    make_devices(clear=False, file="diffractometers.yml", device_manager=instrument)
-except (ImportError, ModuleNotFoundError) as exinfo:
-    print(f"No hklpy2 diffractometers: {exinfo=}")
+if iconfig.get("DIFFRACTOMETERS", True):
+    _load_diffractometers()
 
 # Setup baseline stream with connect=False is default
 # Devices with the label 'baseline' will be added to the baseline stream.
@@ -168,9 +201,20 @@ setup_baseline_stream(sd, oregistry, connect=False)
 sd.monitors.append(oregistry["temperature"])
 
 
-from .plans.sim_plans import sim_count_plan  # noqa: E402, F401
-from .plans.sim_plans import sim_print_plan  # noqa: E402, F401
-from .plans.sim_plans import sim_rel_scan_plan  # noqa: E402, F401
+# The simulator plans are imported lazily (PEP 562): sessions that
+# never call them do not pay for sim_plans' transitive imports.
+_SIM_PLANS = ("sim_count_plan", "sim_print_plan", "sim_rel_scan_plan")
+
+
+def __getattr__(name):
+    """Lazy-import the simulator plans on first access."""
+    if name in _SIM_PLANS:
+        from .plans import sim_plans
+
+        globals().update({nm: getattr(sim_plans, nm) for nm in _SIM_PLANS})
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # ---------------------------
 # --------------------------- local changes
@@ -188,3 +232,8 @@ def on_startup():
 
 
 RE(on_startup())
+
+# Star-import reads only the module __dict__ (plus __all__); list the
+# lazy simulator plans explicitly so 'from bits2511.startup import *'
+# triggers the PEP 562 loader for them too.
+__all__ = sorted({nm for nm in globals() if not nm.startswith("_")} | set(_SIM_PLANS))